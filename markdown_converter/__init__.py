@@ -28,6 +28,31 @@ Example:
 Version: 1.0.0
 """
 
-from .markdown_converter import MarkdownConverter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .markdown_converter import MarkdownConverter
 
 __all__ = ['MarkdownConverter']
+
+def __getattr__(name: str) -> Any:
+    """Import the package's public names on first access.
+
+    The converter pulls in the coordinators, validators and database
+    driver. Importing it lazily means that using a subpackage such as
+    markdown_parser on its own does not pay for that import chain.
+
+    Args:
+        name (str): Attribute requested from the package
+
+    Returns:
+        Any: The requested public object
+
+    Raises:
+        AttributeError: If the package has no such attribute
+    """
+    if name == 'MarkdownConverter':
+        from .markdown_converter import MarkdownConverter
+        globals()[name] = MarkdownConverter
+        return MarkdownConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
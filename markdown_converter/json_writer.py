@@ -25,6 +25,11 @@ import json
 import os
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 class JSONWriter:
     def __init__(self, output_path: str) -> None:
         """Initialize the JSONWriter with an output file path.
@@ -53,6 +58,13 @@ class JSONWriter:
         2. Serializes the data to JSON with consistent formatting (2-space indent)
         3. Writes the content using UTF-8 encoding for universal compatibility
 
+        When the optional orjson package is installed it is used as the
+        encoder, which is considerably faster on the nested dict/list/str
+        trees produced by the parser. Otherwise the stdlib json module is used,
+        configured to match: non-ASCII text is written as UTF-8 rather than
+        escaped, non-string keys are converted to strings by both, and the two
+        encoders produce the same bytes for parser output.
+
         Args:
             data (Dict[str, Any]): The data to be written as JSON.
                 Must be JSON-serializable (containing only basic Python types:
@@ -77,5 +89,9 @@ class JSONWriter:
         """
         if os.path.dirname(self.output_path):
             os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+        if orjson is not None:
+            with open(self.output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
         with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, indent=2, ensure_ascii=False)
@@ -27,9 +27,12 @@ Example:
 """
 
 import re
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, Iterable, Union
 from .base_handler import ParserHandler
 
+# Compiled once at import and shared by every accumulator instance.
+_HEADING_RE = re.compile(r'^#{1,6}\s+.+$')
+
 class ContentAccumulator(ParserHandler):
     """Accumulates and organizes content between markdown headings.
 
@@ -41,14 +44,18 @@ class ContentAccumulator(ParserHandler):
     1. Preserves empty lines within content blocks
     2. Maintains original line endings
     3. Groups content until the next heading is found
-    4. Joins content blocks with newlines
+    4. Joins content blocks with newlines, collecting lines in a list and
+       joining once per block (never via repeated string concatenation,
+       which is quadratic in the block length)
     5. Handles both raw content and partially processed input
 
     Attributes:
         heading_pattern (re.Pattern): Compiled regex for heading detection
     """
 
-    def handle(self, content: Union[List[str], Dict[str, Any]]) -> Dict[str, Any]:
+    heading_pattern = _HEADING_RE
+
+    def handle(self, content: Union[Iterable[str], Dict[str, Any]]) -> Dict[str, Any]:
         """Process content to accumulate text between headings.
 
         Analyzes the content line by line, accumulating text into blocks
@@ -57,9 +64,9 @@ class ContentAccumulator(ParserHandler):
         between sections.
 
         Args:
-            content (Union[List[str], Dict[str, Any]]): The content to
+            content (Union[Iterable[str], Dict[str, Any]]): The content to
                 process. Can be either:
-                - List[str]: Raw markdown lines
+                - Iterable[str]: Raw markdown lines, consumed lazily
                 - Dict[str, Any]: Partially processed content with
                   'content' key containing lines
 
@@ -88,10 +95,10 @@ class ContentAccumulator(ParserHandler):
         current_block = []
         
         for line in content:
-            if re.match(r'^#{1,6}\s+.+$', line):
+            if line.startswith('#') and _HEADING_RE.match(line):
                 if current_block:
                     blocks.append('\n'.join(current_block))
-                    current_block = []
+                    current_block.clear()
             else:
                 # Keep empty lines by appending them even if they're empty
                 current_block.append(line.rstrip())
@@ -25,9 +25,12 @@ Example:
 """
 
 import re
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, Iterable, Union
 from .base_handler import ParserHandler
 
+# Compiled once at import and shared by every detector instance.
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+
 class HeadingDetector(ParserHandler):
     """Detects and processes markdown heading structures.
 
@@ -45,7 +48,9 @@ class HeadingDetector(ParserHandler):
         heading_pattern (re.Pattern): Compiled regex for heading detection
     """
 
-    def handle(self, content: Union[List[str], Dict[str, Any]]) -> Dict[str, Any]:
+    heading_pattern = _HEADING_RE
+
+    def handle(self, content: Union[Iterable[str], Dict[str, Any]]) -> Dict[str, Any]:
         """Process content to detect and extract heading information.
 
         Analyzes the provided content line by line to identify markdown
@@ -53,9 +58,9 @@ class HeadingDetector(ParserHandler):
         number of '#' characters) and title text.
 
         Args:
-            content (Union[List[str], Dict[str, Any]]): The content to
+            content (Union[Iterable[str], Dict[str, Any]]): The content to
                 process. Can be either:
-                - List[str]: Raw markdown lines
+                - Iterable[str]: Raw markdown lines, consumed lazily
                 - Dict[str, Any]: Partially processed content with
                   'content' key containing lines
 
@@ -79,9 +84,9 @@ class HeadingDetector(ParserHandler):
         headings = []
         for line in content:
             line = line.strip()
-            if not line:
+            if not line.startswith('#'):
                 continue
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            heading_match = _HEADING_RE.match(line)
             if heading_match:
                 headings.append({
                     'level': len(heading_match.group(1)),
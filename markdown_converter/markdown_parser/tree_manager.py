@@ -26,6 +26,8 @@ Example:
     Main 1
 """
 
+from array import array
+from bisect import bisect_left
 from typing import Dict, Any, List
 from .base_handler import ParserHandler
 
@@ -55,12 +57,18 @@ class TreeManager(ParserHandler):
         structure that represents the document's organization. Uses a stack
         to maintain proper section nesting based on heading levels.
 
+        The levels of the open sections are mirrored in a parallel int8
+        array. Since they are strictly increasing, the sections to close for
+        a new heading are found with a single bisect rather than popping
+        one node at a time.
+
         Args:
             content (Dict[str, Any]): Dictionary containing:
                 - headings: List of heading dictionaries with:
                     - title: str
                     - level: int (1-6)
-                - blocks: List of content strings
+                - blocks: List of content strings, each already joined
+                  into a single string by the upstream accumulator
 
         Returns:
             Dict[str, Any]: A dictionary containing:
@@ -91,11 +99,14 @@ class TreeManager(ParserHandler):
         
         root: List[Dict[str, Any]] = []
         stack: List[Dict[str, Any]] = []
+        stack_levels = array('b')
         current_content_index = 0
 
         for heading in headings:
-            while stack and stack[-1]['level'] >= heading['level']:
-                stack.pop()
+            level = heading['level']
+            cut = bisect_left(stack_levels, level)
+            del stack_levels[cut:]
+            del stack[cut:]
 
             # Get section content
             section_content = ''
@@ -106,7 +117,7 @@ class TreeManager(ParserHandler):
             node = {
                 'title': heading['title'],
                 'content': section_content,
-                'level': heading['level'],
+                'level': level,
                 'children': []
             }
 
@@ -116,5 +127,6 @@ class TreeManager(ParserHandler):
                 stack[-1]['children'].append(node)
             
             stack.append(node)
+            stack_levels.append(level)
 
         return {'tree': root}
@@ -21,11 +21,23 @@ Example:
 """
 
 import os
-from typing import Dict, Any, List
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 from .markdown_parser.heading_detector import HeadingDetector
 from .markdown_parser.content_accumulator import ContentAccumulator
 from .markdown_parser.tree_manager import TreeManager
 
+# Parsed output keyed by (basename, content digest). Watch-mode and incremental
+# builds re-parse unchanged files repeatedly; a hit skips the handler chain.
+_PARSE_CACHE_SIZE = 128
+_PARSE_CACHE: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+# Guards _PARSE_CACHE; parsers may run on several threads at once. Cached
+# entries are never mutated, so copying them needs no lock.
+_PARSE_CACHE_LOCK = threading.Lock()
+
 class MarkdownParser:
     """Main parser class that coordinates the markdown parsing process.
 
@@ -70,6 +82,12 @@ class MarkdownParser:
         building up a structured representation of the document. The final
         output is wrapped in a dictionary keyed by the source filename.
 
+        Results are memoized in a bounded LRU cache keyed by the source
+        basename and a BLAKE2 digest of the content, so re-parsing an
+        unchanged document returns a deep copy of the cached result. The
+        cache is shared by all parsers and is safe to use from several
+        threads.
+
         Args:
             content (List[str]): The markdown content to parse. Each string
                 in the list represents one line from the source file.
@@ -86,6 +104,41 @@ class MarkdownParser:
             >>> result["test.md"][0]["title"] == "Title"
             True
         """
+        basename = os.path.basename(self.source_file)
+        hasher = hashlib.blake2b(digest_size=16)
+        for line in content:
+            # Length-prefix each line so that different line splits of the
+            # same text cannot produce the same digest
+            encoded = line.encode('utf-8')
+            hasher.update(len(encoded).to_bytes(8, 'little'))
+            hasher.update(encoded)
+        key = (basename, hasher.digest())
+
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = self._parse_uncached(content, basename)
+        entry = copy.deepcopy(result)
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = entry
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        return result
+
+    def _parse_uncached(self, content: List[str], basename: str) -> Dict[str, Any]:
+        """Run the handler chain and wrap the resulting tree.
+
+        Args:
+            content (List[str]): The markdown lines to parse.
+            basename (str): Source filename used as the output key.
+
+        Returns:
+            Dict[str, Any]: The structured document keyed by basename.
+        """
         parsed_content: Dict[str, Any] = {'content': content}
         
         for handler in self.handlers:
@@ -95,7 +148,7 @@ class MarkdownParser:
         tree = parsed_content.get('tree', [])
         if not tree:
             return {
-                os.path.basename(self.source_file): [{
+                basename: [{
                     'title': "Document",
                     'content': "",
                     'level': 1,
@@ -105,7 +158,7 @@ class MarkdownParser:
 
         first_node = tree[0]
         return {
-            os.path.basename(self.source_file): [{
+            basename: [{
                 'title': first_node.get('title', "Document"),
                 'content': first_node.get('content', ""),
                 'level': 1,
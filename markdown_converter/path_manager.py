@@ -104,7 +104,7 @@ class PathManager:
             True
         """
         directory = os.path.dirname(path)
-        if directory and not os.path.exists(directory):
+        if directory:
             os.makedirs(directory, exist_ok=True)
 
     def get_default_output_path(self, source_file: str, extension: str = '.json') -> str:
@@ -38,11 +38,64 @@ Example:
     >>> print("Valid" if is_valid else f"Error: {error}")
 """
 
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
 from .schema_validator import SchemaValidator
 from .content_validator import ContentValidator
 from .structure_validator import StructureValidator
 
+def _is_valid_section(section: Any) -> bool:
+    """Return True if a section passes the schema and content checks."""
+    if not isinstance(section, dict):
+        return False
+    try:
+        title = section['title']
+        content = section['content']
+        level = section['level']
+        children = section['children']
+    except KeyError:
+        return False
+    return (
+        type(title) is str and bool(title.strip())
+        and type(content) is str
+        and type(level) is int
+        and type(children) is list
+    )
+
+def _validate_section_list(sections: List[Any]) -> bool:
+    """Check a section list in one pass against all validation rules.
+
+    This is a specialization of the schema, content and structure checks
+    for the single-document shape emitted by the parser. It only answers
+    whether the sections are valid; on failure the full validators are run
+    to produce a detailed error message.
+
+    Args:
+        sections (List[Any]): Top-level sections of a single document.
+
+    Returns:
+        bool: True if every section in the tree is valid, False otherwise.
+    """
+    stack = []
+    current_level = 0
+    for section in sections:
+        if not _is_valid_section(section):
+            return False
+        level = section['level']
+        if level > current_level + 1:
+            return False
+        current_level = level
+        stack.append(section)
+
+    while stack:
+        node = stack.pop()
+        parent_level = node['level']
+        for child in node['children']:
+            if not _is_valid_section(child) or child['level'] <= parent_level:
+                return False
+            stack.append(child)
+
+    return True
+
 class Validator:
     """Main validator class orchestrating the validation process.
 
@@ -75,6 +128,10 @@ class Validator:
         the first validation failure. The validation order is important as
         each stage builds on the assumptions of the previous stage.
 
+        The parser always emits a single filename mapped to a section list,
+        so that shape is first checked with a fused single-pass walk. Only
+        when it fails are the individual validators run to report the error.
+
         Args:
             data (Dict[str, Any]): The data structure to validate. Should
                 be a dictionary with filename keys and section list values.
@@ -91,6 +148,13 @@ class Validator:
             >>> if not valid:
             ...     print(f"Validation failed: {error}")
         """
+        # Fast path for the single-document shape produced by the parser
+        if isinstance(data, dict) and len(data) == 1:
+            filename, sections = next(iter(data.items()))
+            if (isinstance(filename, str) and isinstance(sections, list)
+                    and _validate_section_list(sections)):
+                return True, ""
+
         # Schema validation
         valid, error = self.schema_validator.validate(data)
         if not valid:
@@ -5,6 +5,6 @@ This package contains the base validation classes and utilities used by all vali
 """
 
 from .base_validator import ValidationStrategy
-from .error_handler import ValidationError, ErrorFormatter
+from .error_handler import ValidationError, ErrorFormatter, error_formatter
 
-__all__ = ['ValidationStrategy', 'ValidationError', 'ErrorFormatter']
+__all__ = ['ValidationStrategy', 'ValidationError', 'ErrorFormatter', 'error_formatter']
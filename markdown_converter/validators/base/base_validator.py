@@ -25,7 +25,7 @@ Example:
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Tuple, Optional
-from .error_handler import ValidationError, ErrorFormatter
+from .error_handler import ValidationError, ErrorFormatter, error_formatter
 
 class ValidationStrategy(ABC):
     """Abstract base class defining the validation strategy interface.
@@ -36,16 +36,16 @@ class ValidationStrategy(ABC):
     checking and error handling.
 
     The class uses composition with ErrorFormatter for consistent error
-    message formatting across all validation strategies.
+    message formatting across all validation strategies. The formatter is
+    stateless, so a single shared instance is held at class level rather
+    than created for every validator.
 
     Attributes:
         error_formatter (ErrorFormatter): Utility for formatting error messages
             in a consistent way across all validators.
     """
 
-    def __init__(self):
-        """Initialize the validation strategy."""
-        self.error_formatter = ErrorFormatter()
+    error_formatter: ErrorFormatter = error_formatter
 
     @abstractmethod
     def validate(self, data: Dict[str, Any]) -> Tuple[bool, Optional[ValidationError]]:
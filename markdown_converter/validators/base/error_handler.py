@@ -34,7 +34,10 @@ class ValidationError(Exception):
     Attributes:
         message (str): Detailed error message explaining the validation failure
     """
-    
+
+    # Store the message in a slot so no instance __dict__ is allocated
+    __slots__ = ('message',)
+
     def __init__(self, message: str):
         """
         Initialize ValidationError.
@@ -53,6 +56,9 @@ class ErrorFormatter:
     Each method focuses on a specific type of error (type mismatch,
     missing field, etc.) and generates an appropriate error message.
 
+    The class holds no state, so its methods are static and validators
+    share the module-level error_formatter instance.
+
     The formatted messages are designed to be:
     - Clear and concise
     - Consistent in structure
@@ -60,7 +66,10 @@ class ErrorFormatter:
     - User-friendly for error reporting
     """
 
-    def format_type_error(self, value: Any, expected_type: type, context: str) -> str:
+    __slots__ = ()
+
+    @staticmethod
+    def format_type_error(value: Any, expected_type: type, context: str) -> str:
         """Format error message for type validation failures.
 
         Creates a formatted error message when a value's type doesn't match
@@ -86,7 +95,8 @@ class ErrorFormatter:
             f"got {type(value).__name__} instead"
         )
 
-    def format_empty_error(self, context: str) -> str:
+    @staticmethod
+    def format_empty_error(context: str) -> str:
         """Format error message for empty value validation failures.
 
         Creates a formatted error message when a required value is empty.
@@ -107,7 +117,8 @@ class ErrorFormatter:
         """
         return f"{context} cannot be empty"
 
-    def format_missing_field_error(self, field: str, context: str) -> str:
+    @staticmethod
+    def format_missing_field_error(field: str, context: str) -> str:
         """Format error message for missing required fields.
 
         Creates a formatted error message when a required field is missing
@@ -129,7 +140,8 @@ class ErrorFormatter:
         """
         return f"Missing required field '{field}' in {context}"
 
-    def format_invalid_value_error(self, value: Any, context: str, reason: str) -> str:
+    @staticmethod
+    def format_invalid_value_error(value: Any, context: str, reason: str) -> str:
         """Format error message for invalid value validation failures.
 
         Creates a formatted error message when a value is invalid for
@@ -154,7 +166,8 @@ class ErrorFormatter:
         """
         return f"Invalid value '{value}' in {context}: {reason}"
 
-    def format_structure_error(self, context: str, details: str) -> str:
+    @staticmethod
+    def format_structure_error(context: str, details: str) -> str:
         """Format error message for structural validation failures.
 
         Creates a formatted error message when the structure of the data
@@ -178,3 +191,6 @@ class ErrorFormatter:
             "Invalid structure in Document: Section level cannot decrease by more than 1"
         """
         return f"Invalid structure in {context}: {details}"
+
+# Shared formatter instance used by all validation strategies
+error_formatter = ErrorFormatter()
@@ -34,6 +34,12 @@ from typing import Dict, Any, Tuple, Optional
 from .base.base_validator import ValidationStrategy
 from .base.error_handler import ValidationError
 
+def _title_context(filename: str, parent: Optional[str]) -> str:
+    """Describe where a section title sits for error messages."""
+    if parent is None:
+        return f"Title in {filename}"
+    return f"Title in child section of '{parent.strip()}'"
+
 class ContentValidator(ValidationStrategy):
     """Validates document content values and relationships.
 
@@ -56,7 +62,7 @@ class ContentValidator(ValidationStrategy):
 
         Performs comprehensive content validation, ensuring all sections
         have valid titles and content. This includes checking both
-        top-level sections and recursively validating child sections.
+        top-level sections and all nested child sections.
 
         Args:
             data (Dict[str, Any]): Document data to validate, containing:
@@ -86,115 +92,66 @@ class ContentValidator(ValidationStrategy):
             >>> if not valid:
             ...     print(f"Content error: {error}")
         """
+        # Bind the formatters and the dict/str methods once; error contexts
+        # are only built in the failure branches so valid sections allocate
+        # no message strings
+        format_empty_error = self.error_formatter.format_empty_error
+        format_type_error = self.error_formatter.format_type_error
+        str_strip = str.strip
+        dict_get = dict.get
+
+        if not isinstance(data, dict):
+            return False, ValidationError(
+                format_type_error(data, dict, "Document data")
+            )
+
         try:
             for filename, sections in data.items():
                 if not isinstance(sections, list):
                     continue
 
-                for section in sections:
-                    # Validate title not empty
-                    title = section.get('title', '').strip()
-                    if not self._check_not_empty(title, f"Title in {filename}"):
-                        return False, ValidationError(
-                            self.error_formatter.format_empty_error(
-                                f"Title in {filename}"
-                            )
-                        )
+                # Walk the section tree depth-first with an explicit stack of
+                # (section, parent title) pairs; None marks a top-level section
+                stack = [(section, None) for section in reversed(sections)]
+                while stack:
+                    section, parent = stack.pop()
+
+                    # Sections must be dictionaries for the bound dict.get
+                    if not isinstance(section, dict):
+                        raise ValidationError(format_type_error(
+                            section, dict, f"Section in {filename}" if parent is None
+                            else f"Child section of '{parent.strip()}'"
+                        ))
+
+                    # Validate title is a non-empty string
+                    title = dict_get(section, 'title', '')
+                    if type(title) is not str:
+                        raise ValidationError(format_type_error(
+                            title, str, _title_context(filename, parent)
+                        ))
+                    # Stripping is only needed to detect blank titles; the
+                    # stripped copy is built for messages on failure only
+                    if not (title and str_strip(title)):
+                        raise ValidationError(format_empty_error(
+                            _title_context(filename, parent)
+                        ))
 
                     # Content must be string
-                    content = section.get('content', '')
-                    if not self._check_type(content, str, f"Content in section '{title}'"):
-                        return False, ValidationError(
-                            self.error_formatter.format_type_error(
-                                content,
-                                str,
-                                f"Content in section '{title}'"
-                            )
-                        )
-
-                    # Validate children recursively
-                    children = section.get('children', [])
-                    if not self._check_type(children, list, f"Children in section '{title}'"):
-                        return False, ValidationError(
-                            self.error_formatter.format_type_error(
-                                children,
-                                list,
-                                f"Children in section '{title}'"
-                            )
-                        )
-
-                    for child in children:
-                        valid, error = self._validate_section(child, title)
-                        if not valid:
-                            return False, error
-
-            return True, None
-        except Exception as e:
-            return False, ValidationError(str(e))
-
-    def _validate_section(self, section: Dict[str, Any], parent: str) -> Tuple[bool, Optional[ValidationError]]:
-        """Validate content of an individual section.
-
-        Performs detailed validation of a single section's content,
-        including title, content text, and recursive validation of
-        child sections.
-
-        Args:
-            section (Dict[str, Any]): Section data to validate
-            parent (str): Parent section title for context
-
-        Returns:
-            Tuple[bool, Optional[ValidationError]]: A tuple containing:
-                - bool: True if section content is valid, False otherwise
-                - Optional[ValidationError]: Error details if invalid,
-                  None if valid
-
-        Example:
-            >>> validator = ContentValidator()
-            >>> section = {
-            ...     "title": "Valid Title",
-            ...     "content": "Valid content",
-            ...     "level": 1,
-            ...     "children": []
-            ... }
-            >>> valid, error = validator._validate_section(
-            ...     section, "Parent Section"
-            ... )
-        """
-        # Title required and not empty
-        title = section.get('title', '').strip()
-        if not self._check_not_empty(title, f"Title in child section of '{parent}'"):
-            return False, ValidationError(
-                self.error_formatter.format_empty_error(
-                    f"Title in child section of '{parent}'"
-                )
-            )
+                    content = dict_get(section, 'content', '')
+                    if type(content) is not str:
+                        raise ValidationError(format_type_error(
+                            content, str, f"Content in section '{str_strip(title)}'"
+                        ))
 
-        # Content must be string
-        content = section.get('content', '')
-        if not self._check_type(content, str, f"Content in section '{title}'"):
-            return False, ValidationError(
-                self.error_formatter.format_type_error(
-                    content,
-                    str,
-                    f"Content in section '{title}'"
-                )
-            )
+                    # Children must be a list
+                    children = dict_get(section, 'children', [])
+                    if type(children) is not list:
+                        raise ValidationError(format_type_error(
+                            children, list, f"Children in section '{str_strip(title)}'"
+                        ))
 
-        # Validate children recursively
-        children = section.get('children', [])
-        if not self._check_type(children, list, f"Children in section '{title}'"):
-            return False, ValidationError(
-                self.error_formatter.format_type_error(
-                    children,
-                    list,
-                    f"Children in section '{title}'"
-                )
-            )
-
-        for child in children:
-            valid, error = self._validate_section(child, title)
-            if not valid:
-                return False, error
+                    stack.extend((child, title) for child in reversed(children))
 
-        return True, None
+            return True, None
+        except ValidationError as e:
+            return False, e
@@ -25,10 +25,90 @@ Example:
     >>> print("Valid schema" if is_valid else f"Invalid: {error}")
 """
 
-from typing import Dict, Any, Tuple, Optional, Set
+from operator import itemgetter
+from typing import Dict, Any, Callable, FrozenSet, Iterator, List, Tuple, Optional, Union
 from .base.base_validator import ValidationStrategy
 from .base.error_handler import ValidationError
 
+# Expected type and display name for each required section field
+_FIELD_TYPES = (
+    ('title', str, "Title"),
+    ('content', str, "Content"),
+    ('level', int, "Level"),
+    ('children', list, "Children")
+)
+
+# Section path: a filename for top-level sections, otherwise a
+# (parent path, parent title) pair, joined only when formatting an error
+SectionPath = Union[str, Tuple[Any, str]]
+
+def _format_path(path: SectionPath) -> str:
+    """Join a section path into its 'file -> title -> ...' display form.
+
+    Args:
+        path (SectionPath): Filename or nested (parent path, title) pair.
+
+    Returns:
+        str: Path components joined with ' -> '.
+
+    Example:
+        >>> _format_path((("doc.md", "Intro"), "Details"))
+        'doc.md -> Intro -> Details'
+    """
+    titles = []
+    while type(path) is tuple:
+        path, title = path
+        titles.append(title)
+    titles.append(path)
+    return ' -> '.join(reversed(titles))
+
+def _build_field_checker(field_types: Tuple[Tuple[str, type, str], ...]) -> Callable[..., Optional[str]]:
+    """Generate a straight-line type checker for the given section fields.
+
+    The field list is fixed, so instead of looping over it and dispatching
+    through _check_type for every section, the checks are emitted once as
+    plain statements and compiled into a single function. Fields must
+    have exactly the expected type; subclasses (including bool for int)
+    are rejected.
+
+    Args:
+        field_types (Tuple[Tuple[str, type, str], ...]): Field name, expected
+            type and display name for each field to check.
+
+    Returns:
+        Callable[..., Optional[str]]: Function taking (field values in
+            field_types order, section path, format_type_error) that
+            returns the error message for the first field with the wrong
+            type, or None if all fields are valid.
+
+    Example:
+        >>> check = _build_field_checker((('title', str, "Title"),))
+        >>> check((1,), "doc.md", ErrorFormatter.format_type_error)
+        'Title in doc.md must be a str, got int instead'
+    """
+    namespace: Dict[str, Any] = {'format_path': _format_path}
+    names = [f'value{index}' for index in range(len(field_types))]
+    lines = [
+        "def check_fields(values, context, format_type_error):",
+        f"    {', '.join(names)}, = values",
+    ]
+    for index, (_, expected_type, field_name) in enumerate(field_types):
+        namespace[f'_type{index}'] = expected_type
+        lines.append(f"    if type(value{index}) is not _type{index}:")
+        lines.append(
+            f"        return format_type_error("
+            f"value{index}, _type{index}, {field_name + ' in '!r} + format_path(context))"
+        )
+    lines.append("    return None")
+    exec('\n'.join(lines), namespace)
+    return namespace['check_fields']
+
+# Fetches the required section fields as a tuple in _FIELD_TYPES order
+_get_fields = itemgetter(*(field for field, _, _ in _FIELD_TYPES))
+
+# Type checks for the required section fields, compiled once at import
+_check_fields = _build_field_checker(_FIELD_TYPES)
+
 class SchemaValidator(ValidationStrategy):
     """Validates document schema structure and field types.
 
@@ -43,20 +123,17 @@ class SchemaValidator(ValidationStrategy):
 
     Attributes:
         error_formatter (ErrorFormatter): Utility for consistent error messages
-        required_fields (Set[str]): Set of required section fields
+        required_fields (FrozenSet[str]): Set of required section fields
     """
 
-    def __init__(self):
-        """Initialize schema validator with required fields."""
-        super().__init__()
-        self.required_fields: Set[str] = {'title', 'content', 'level', 'children'}
+    required_fields: FrozenSet[str] = frozenset(field for field, _, _ in _FIELD_TYPES)
 
     def validate(self, data: Dict[str, Any]) -> Tuple[bool, Optional[ValidationError]]:
         """Validate document schema compliance.
 
         Performs comprehensive schema validation, ensuring all required
         fields are present and have correct types. This includes checking
-        both top-level structure and recursive validation of sections.
+        both top-level structure and every nested section.
 
         Args:
             data (Dict[str, Any]): Document data to validate, containing:
@@ -87,53 +164,106 @@ class SchemaValidator(ValidationStrategy):
             >>> if not valid:
             ...     print(f"Schema error: {error}")
         """
-        try:
-            # Validate top level structure
-            if not self._check_type(data, dict, "Document data"):
-                return False, ValidationError(
-                    self.error_formatter.format_type_error(data, dict, "Document data")
+        # The error generator is lazy, so only the walk up to the first
+        # error is performed
+        error = next(self._iter_errors(data), None)
+        return error is None, error
+
+    def validate_all(self, data: Dict[str, Any]) -> List[ValidationError]:
+        """Collect every schema error in the document in a single pass.
+
+        Unlike validate(), which stops at the first error, this walks the
+        whole document so that all problems can be fixed before validating
+        again. Children of an invalid section are not checked, since their
+        container may itself be malformed.
+
+        Args:
+            data (Dict[str, Any]): Document data to validate, in the same
+                format accepted by validate().
+
+        Returns:
+            List[ValidationError]: Errors in document order; empty if the
+                schema is valid.
+
+        Example:
+            >>> validator = SchemaValidator()
+            >>> data = {"doc.md": [
+            ...     {"title": 1, "content": "", "level": 1, "children": []},
+            ...     {"title": "B", "content": None, "level": 1, "children": []}
+            ... ]}
+            >>> for error in validator.validate_all(data):
+            ...     print(error)
+            Title in doc.md must be a str, got int instead
+            Content in doc.md must be a str, got NoneType instead
+        """
+        return list(self._iter_errors(data))
+
+    def _iter_errors(self, data: Dict[str, Any]) -> Iterator[ValidationError]:
+        """Walk the document and yield each schema error in document order.
+
+        Args:
+            data (Dict[str, Any]): Document data to validate.
+
+        Yields:
+            ValidationError: Each schema violation found.
+        """
+        format_type_error = self.error_formatter.format_type_error
+
+        if not isinstance(data, dict):
+            yield ValidationError(format_type_error(data, dict, "Document data"))
+            return
+        if not data:
+            yield ValidationError(
+                self.error_formatter.format_empty_error("Document data")
+            )
+            return
+
+        # Bind hot-loop callables once instead of per section
+        validate_section = self._validate_section
+
+        # Validate each document section
+        for filename, sections in data.items():
+            if not isinstance(filename, str):
+                yield ValidationError(format_type_error(filename, str, "Filename"))
+                continue
+            if not isinstance(sections, list):
+                yield ValidationError(
+                    format_type_error(sections, list, f"Sections for {filename}")
                 )
-            if not self._check_not_empty(data, "Document data"):
-                return False, ValidationError(
-                    self.error_formatter.format_empty_error("Document data")
+                continue
+
+            # Walk the section tree depth-first with an explicit stack,
+            # pushing children in reverse to keep document order
+            stack = [(section, filename) for section in reversed(sections)]
+            while stack:
+                section, context = stack.pop()
+                error = validate_section(section, context)
+                if error is not None:
+                    yield ValidationError(error)
+                    continue
+                child_context = (context, section['title'])
+                stack.extend(
+                    (child, child_context) for child in reversed(section['children'])
                 )
 
-            # Validate each document section
-            for filename, sections in data.items():
-                if not self._check_type(filename, str, "Filename"):
-                    return False, ValidationError(
-                        self.error_formatter.format_type_error(filename, str, "Filename")
-                    )
-                if not self._check_type(sections, list, f"Sections for {filename}"):
-                    return False, ValidationError(
-                        self.error_formatter.format_type_error(sections, list, f"Sections for {filename}")
-                    )
-
-                # Validate each section
-                for section in sections:
-                    valid, error = self._validate_section(section, filename)
-                    if not valid:
-                        return False, error
-
-            return True, None
-        except Exception as e:
-            return False, ValidationError(str(e))
-
-    def _validate_section(self, section: Dict[str, Any], context: str) -> Tuple[bool, Optional[ValidationError]]:
+    def _validate_section(self, section: Dict[str, Any], context: SectionPath) -> Optional[str]:
         """Validate an individual document section.
 
         Performs detailed validation of a single section, checking required
-        fields, field types, and recursively validating child sections.
+        fields and field types. Child sections are not visited here; the
+        caller traverses the tree iteratively.
+
+        Nothing is raised on this per-section path: the error message is
+        returned and the caller wraps it in a ValidationError once.
 
         Args:
             section (Dict[str, Any]): Section data to validate
-            context (str): Document/section context for error messages
+            context (SectionPath): Filename or (parent path, title) pair
+                locating the section, joined only for error messages
 
         Returns:
-            Tuple[bool, Optional[ValidationError]]: A tuple containing:
-                - bool: True if section is valid, False otherwise
-                - Optional[ValidationError]: Error details if invalid,
-                  None if valid
+            Optional[str]: Error message if the section is invalid,
+                None if valid
 
         Example:
             >>> validator = SchemaValidator()
@@ -143,48 +273,26 @@ class SchemaValidator(ValidationStrategy):
             ...     "level": 1,
             ...     "children": []
             ... }
-            >>> valid, error = validator._validate_section(
-            ...     section, "doc.md"
-            ... )
+            >>> print(validator._validate_section(section, "doc.md"))
+            None
         """
-        # Validate section is a dictionary
-        if not self._check_type(section, dict, f"Section in {context}"):
-            return False, ValidationError(
-                self.error_formatter.format_type_error(section, dict, f"Section in {context}")
+        # Validate section is a dictionary; the context is only formatted
+        # when the check fails
+        if not isinstance(section, dict):
+            return self.error_formatter.format_type_error(
+                section, dict, f"Section in {_format_path(context)}"
             )
 
-        # Check required fields
-        missing = self.required_fields - section.keys()
-        if missing:
-            return False, ValidationError(
-                self.error_formatter.format_missing_field_error(
-                    ', '.join(missing),
-                    f"Section in {context}"
-                )
+        # Fetch all required fields in one call; a KeyError means at least
+        # one is absent, and only then is the list of missing names built
+        try:
+            values = _get_fields(section)
+        except KeyError:
+            missing = [name for name, _, _ in _FIELD_TYPES if name not in section]
+            return self.error_formatter.format_missing_field_error(
+                ', '.join(missing),
+                f"Section in {_format_path(context)}"
             )
 
         # Validate field types
-        field_types = {
-            'title': (str, "Title"),
-            'content': (str, "Content"),
-            'level': (int, "Level"),
-            'children': (list, "Children")
-        }
-
-        for field, (expected_type, field_name) in field_types.items():
-            if not self._check_type(section[field], expected_type, f"{field_name} in {context}"):
-                return False, ValidationError(
-                    self.error_formatter.format_type_error(
-                        section[field],
-                        expected_type,
-                        f"{field_name} in {context}"
-                    )
-                )
-
-        # Recursively validate children
-        for child in section['children']:
-            valid, error = self._validate_section(child, f"{context} -> {section['title']}")
-            if not valid:
-                return False, error
-
-        return True, None
+        return _check_fields(values, context, self.error_formatter.format_type_error)
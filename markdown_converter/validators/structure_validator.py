@@ -28,6 +28,7 @@ Example:
     >>> print("Valid structure" if is_valid else f"Invalid: {error}")
 """
 
+from collections import deque
 from typing import Dict, Any, Tuple, List, Optional
 from .base.base_validator import ValidationStrategy
 from .base.error_handler import ValidationError
@@ -86,32 +87,53 @@ class StructureValidator(ValidationStrategy):
             >>> if not valid:
             ...     print(f"Structure error: {error}")
         """
+        if not isinstance(data, dict):
+            return False, ValidationError(
+                self.error_formatter.format_type_error(data, dict, "Document data")
+            )
+
+        # Nothing to check in an empty document
+        if not data:
+            return True, None
+
+        # Bind hot-loop callables once instead of per section
+        format_structure_error = self.error_formatter.format_structure_error
+        validate_children = self._validate_children
+        saw_sections = False
+
         try:
             for filename, sections in data.items():
                 if not isinstance(sections, list):
                     continue
+                saw_sections = True
 
                 # Track section levels
                 current_level = 0
                 for section in sections:
                     level = section.get('level', 0)
                     
-                    # Level can't decrease by more than 1
+                    # Level can't decrease by more than 1; the title is
+                    # only read to build the error message
                     if level > current_level + 1:
                         return False, ValidationError(
-                            self.error_formatter.format_structure_error(
+                            format_structure_error(
                                 filename,
                                 f"Invalid section level jump in {section['title']}"
                             )
                         )
                     
                     # Validate children
-                    valid, error = self._validate_children(section, filename, level)
+                    valid, error = validate_children(section, filename, level)
                     if not valid:
                         return False, error
                     
                     current_level = level
 
+            # A document without a single section list has no structure
+            if not saw_sections:
+                return False, ValidationError(
+                    format_structure_error("Document data", "No sections")
+                )
             return True, None
         except Exception as e:
             return False, ValidationError(str(e))
@@ -119,9 +141,13 @@ class StructureValidator(ValidationStrategy):
     def _validate_children(self, section: Dict[str, Any], context: str, parent_level: int) -> Tuple[bool, Optional[ValidationError]]:
         """Validate hierarchical relationships of section children.
         
-        Recursively validates the structure of section children, ensuring
-        proper level progression and parent-child relationships throughout
-        the section tree.
+        Validates the structure of section children, ensuring proper level
+        progression and parent-child relationships throughout the section
+        tree. Well-formed trees are confirmed by a breadth-first pass that
+        checks each list of siblings at once; only when that pass finds a
+        problem is the tree walked again depth-first, in document order, to
+        report the same first error as before. Neither walk recurses, so
+        deeply nested documents cannot exhaust the Python call stack.
 
         Args:
             section (Dict[str, Any]): Section to validate, containing:
@@ -152,31 +178,97 @@ class StructureValidator(ValidationStrategy):
             ...     section, "doc.md", 1
             ... )
         """
-        if not isinstance(section.get('children'), list):
+        # Bind hot-loop callables once instead of per child
+        format_type_error = self.error_formatter.format_type_error
+        format_structure_error = self.error_formatter.format_structure_error
+
+        # Fields are read by subscript; in a well-formed tree every key is
+        # present, so the KeyError fallbacks cost nothing on that path
+        try:
+            children = section['children']
+        except KeyError:
+            return True, None
+        if not isinstance(children, list) or not children:
             return True, None
 
-        for child in section['children']:
+        # Comparing unorderable levels raises here as it would below, so a
+        # TypeError also defers to the ordered walk
+        try:
+            if self._siblings_well_formed(children, parent_level):
+                return True, None
+        except TypeError:
+            pass
+
+        # Stack entries are (child, parent level); children are pushed in
+        # reverse so they are checked in document order, each followed by
+        # its own subtree
+        stack = [(child, parent_level) for child in reversed(children)]
+        while stack:
+            child, parent_level = stack.pop()
             if not isinstance(child, dict):
                 return False, ValidationError(
-                    self.error_formatter.format_type_error(
+                    format_type_error(
                         child,
                         dict,
                         f"Child section in {context}"
                     )
                 )
 
-            child_level = child.get('level', 0)
+            try:
+                child_level = child['level']
+            except KeyError:
+                child_level = 0
             if child_level <= parent_level:
                 return False, ValidationError(
-                    self.error_formatter.format_structure_error(
+                    format_structure_error(
                         context,
                         f"Child level must be greater than parent level"
                     )
                 )
 
-            # Recursively validate child's children
-            valid, error = self._validate_children(child, context, child_level)
-            if not valid:
-                return False, error
+            try:
+                grandchildren = child['children']
+            except KeyError:
+                continue
+            if isinstance(grandchildren, list):
+                stack.extend((grandchild, child_level) for grandchild in reversed(grandchildren))
 
         return True, None
+
+    @staticmethod
+    def _siblings_well_formed(children: List[Any], parent_level: int) -> bool:
+        """Check a section's descendants breadth-first, a sibling list at a time.
+
+        Each list of siblings is checked with a type scan, one list of
+        levels and a single min() comparison against the parent level, so
+        wide sections cost a few C-level passes instead of a Python loop
+        body per child. The result only says whether the subtree is valid;
+        the caller reports the actual error.
+
+        Args:
+            children (List[Any]): Non-empty list of child sections
+            parent_level (int): Level of the parent section
+
+        Returns:
+            bool: True if every descendant is a dict whose level is greater
+            than its parent's level, False otherwise
+        """
+        queue = deque(((children, parent_level),))
+        pop, push = queue.popleft, queue.append
+        while queue:
+            siblings, parent_level = pop()
+            # Dict subclasses are left to the ordered walk, which accepts them
+            for child in siblings:
+                if type(child) is not dict:
+                    return False
+
+            levels = [child.get('level', 0) for child in siblings]
+            if min(levels) <= parent_level:
+                return False
+
+            for child, level in zip(siblings, levels):
+                grandchildren = child.get('children')
+                if grandchildren and isinstance(grandchildren, list):
+                    push((grandchildren, level))
+
+        return True
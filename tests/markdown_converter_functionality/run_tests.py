@@ -5,57 +5,136 @@ Test runner for MarkdownConverter functionality tests.
 import unittest
 import sys
 import os
+import io
 import time
-from typing import Type, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Sequence, TextIO, Tuple, Type, Optional
 
-def run_test_with_retry(test_case: Type[unittest.TestCase], max_retries: int = 3) -> bool:
-    """Run a test case with retry logic."""
+try:
+    from psycopg2 import OperationalError as DatabaseOperationalError
+except ImportError:  # psycopg2 is only needed by the database tests
+    DatabaseOperationalError = OSError
+
+# Errors worth retrying: I/O and connection problems that may clear up
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (OSError, DatabaseOperationalError)
+
+class RetryAwareResult(unittest.TextTestResult):
+    """Test result that records whether every error was transient."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.only_transient_errors = True
+
+    def addError(self, test, err):
+        """Record the error and note whether its type is transient."""
+        if not issubclass(err[0], TRANSIENT_ERRORS):
+            self.only_transient_errors = False
+        super().addError(test, err)
+
+# Shared loader; test method names are looked up once per test case class
+LOADER = unittest.TestLoader()
+_TEST_NAMES: Dict[Type[unittest.TestCase], List[str]] = {}
+
+def build_suite(test_case: Type[unittest.TestCase]) -> unittest.TestSuite:
+    """Build a fresh suite for a test case from its cached method names."""
+    names = _TEST_NAMES.get(test_case)
+    if names is None:
+        names = _TEST_NAMES[test_case] = LOADER.getTestCaseNames(test_case)
+    return unittest.TestSuite(map(test_case, names))
+
+def run_test_with_retry(test_case: Type[unittest.TestCase], max_retries: int = 3,
+                        stream: Optional[TextIO] = None, buffer: bool = False) -> bool:
+    """Run a test case with retry logic.
+
+    Progress and results go to stream when given, otherwise to stderr.
+    With buffer, output printed by passing tests is discarded; buffering
+    swaps the process-wide sys.stdout/sys.stderr, so it must only be used
+    when no other test runs at the same time.
+    """
     test_name = test_case.__name__
     
     for attempt in range(max_retries):
-        print(f"\n=== Running {test_name} (Attempt {attempt + 1}/{max_retries}) ===")
+        print(f"\n=== Running {test_name} (Attempt {attempt + 1}/{max_retries}) ===", file=stream)
         
-        # Create and run test suite
-        suite = unittest.TestLoader().loadTestsFromTestCase(test_case)
-        runner = unittest.TextTestRunner(verbosity=2)
+        # Create and run test suite; suites are single-use, so a new one is
+        # built for each attempt
+        suite = build_suite(test_case)
+        # Dots instead of per-test names
+        runner = unittest.TextTestRunner(stream=stream, verbosity=1, buffer=buffer,
+                                         resultclass=RetryAwareResult)
         result = runner.run(suite)
         
         if result.wasSuccessful():
-            print(f"\n✅ {test_name} passed!")
+            print(f"\n✅ {test_name} passed!", file=stream)
             return True
+
+        # Assertion failures and non-transient errors will not pass on retry
+        if result.failures or not result.only_transient_errors:
+            print(f"\n❌ {test_name} failed deterministically, not retrying", file=stream)
+            return False
             
         if attempt < max_retries - 1:
-            print(f"\n❌ {test_name} failed, retrying...")
-            time.sleep(1)  # Brief pause before retry
+            print(f"\n❌ {test_name} failed, retrying...", file=stream)
+            time.sleep(0.25 * 2 ** attempt)  # Exponential backoff before retry
     
-    print(f"\n❌ {test_name} failed after {max_retries} attempts, skipping...")
+    print(f"\n❌ {test_name} failed after {max_retries} attempts, skipping...", file=stream)
     return False
 
+def run_test_group(test_cases: Sequence[Type[unittest.TestCase]],
+                   stream: Optional[TextIO] = None, buffer: bool = False) -> List[bool]:
+    """Run test cases that share resources one after another."""
+    return [run_test_with_retry(test_case, stream=stream, buffer=buffer)
+            for test_case in test_cases]
+
 def run_all_tests() -> None:
     """Run all test suites with retry logic."""
     from test_file_operations import TestFileOperations
     from test_conversion import TestConversion
     from test_database import TestDatabase
     from test_integration import TestMarkdownConverterIntegration
+    from test_validators import TestSchemaValidator, TestStructureValidator
     
-    test_cases = [
-        TestFileOperations,
-        TestConversion,
-        TestDatabase,
-        TestMarkdownConverterIntegration
+    # Groups run in parallel on threads and classes within a group run
+    # sequentially. The database tests share one group; so must any tests
+    # that patch module- or class-level attributes, since such patches are
+    # visible to every thread
+    test_groups = [
+        [TestFileOperations],
+        [TestConversion, TestSchemaValidator, TestStructureValidator],
+        [TestDatabase, TestMarkdownConverterIntegration]
     ]
     
     results = {
         'passed': 0,
         'failed': 0,
-        'total': len(test_cases)
+        'total': sum(len(group) for group in test_groups)
     }
     
     print("\n=== Starting Test Execution ===")
     start_time = time.time()
     
-    for test_case in test_cases:
-        if run_test_with_retry(test_case):
+    outcomes: List[bool] = []
+    if os.environ.get('TEST_RUNNER_SEQUENTIAL'):
+        # Sequential mode for debugging, with results streamed as they
+        # happen; only here can test output be buffered safely
+        for group in test_groups:
+            outcomes.extend(run_test_group(group, buffer=True))
+    else:
+        # Each group writes its results to its own buffer, printed once the
+        # group is done so that results from different groups are not
+        # interleaved. Test output is not buffered: that would swap
+        # sys.stdout under the other threads.
+        with ThreadPoolExecutor(max_workers=len(test_groups)) as executor:
+            futures = {}
+            for group in test_groups:
+                buffer = io.StringIO()
+                futures[executor.submit(run_test_group, group, buffer)] = buffer
+            for future in as_completed(futures):
+                print(futures[future].getvalue(), end='')
+                outcomes.extend(future.result())
+    
+    for passed in outcomes:
+        if passed:
             results['passed'] += 1
         else:
             results['failed'] += 1
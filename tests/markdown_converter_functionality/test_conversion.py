@@ -4,44 +4,40 @@ Unit tests for ConversionCoordinator.
 
 import unittest
 import os
+import shutil
+import tempfile
+from unittest.mock import patch
 from markdown_converter.coordinators.conversion import ConversionCoordinator
 
 class TestConversion(unittest.TestCase):
     """Test cases for ConversionCoordinator."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = os.path.join('tests', 'markdown_converter_functionality', 'test_files')
-        os.makedirs(self.test_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once; the tests only read these files."""
+        cls.test_dir = tempfile.mkdtemp()
         
         # Create test files
-        self.single_heading = os.path.join(self.test_dir, 'single_heading.md')
-        with open(self.single_heading, 'w') as f:
+        cls.single_heading = os.path.join(cls.test_dir, 'single_heading.md')
+        with open(cls.single_heading, 'w') as f:
             f.write("# Main Heading\nMain content")
             
-        self.multiple_headings = os.path.join(self.test_dir, 'multiple_headings.md')
-        with open(self.multiple_headings, 'w') as f:
+        cls.multiple_headings = os.path.join(cls.test_dir, 'multiple_headings.md')
+        with open(cls.multiple_headings, 'w') as f:
             f.write("# First\nContent 1\n# Second\nContent 2")
             
-        self.nested_headings = os.path.join(self.test_dir, 'nested_headings.md')
-        with open(self.nested_headings, 'w') as f:
+        cls.nested_headings = os.path.join(cls.test_dir, 'nested_headings.md')
+        with open(cls.nested_headings, 'w') as f:
             f.write("# Main\n## Sub1\nContent 1\n## Sub2\nContent 2")
             
-        self.empty_file = os.path.join(self.test_dir, 'empty.md')
-        with open(self.empty_file, 'w') as f:
+        cls.empty_file = os.path.join(cls.test_dir, 'empty.md')
+        with open(cls.empty_file, 'w') as f:
             f.write("")
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test files."""
-        test_files = [
-            self.single_heading,
-            self.multiple_headings,
-            self.nested_headings,
-            self.empty_file
-        ]
-        for file in test_files:
-            if os.path.exists(file):
-                os.remove(file)
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
 
     def test_single_heading(self):
         """Test converting file with single heading."""
@@ -89,6 +85,33 @@ class TestConversion(unittest.TestCase):
         self.assertEqual(doc['content'], '')
         self.assertEqual(len(doc['children']), 0)
 
+    def test_repeated_conversion_uses_cache(self):
+        """Test that re-converting identical content hits the cache and returns a copy."""
+        coordinator = ConversionCoordinator(self.nested_headings)
+        # Content unique to this test, so no other test has cached it
+        content = ["# Cached Main", "## Sub1", "Content 1", "## Sub2", "Content 2"]
+        parser = coordinator.parser
+        with patch.object(parser, '_parse_uncached', wraps=parser._parse_uncached) as parse:
+            first = coordinator.convert(content)
+            first['nested_headings.md'][0]['children'].clear()
+            second = coordinator.convert(content)
+
+        self.assertEqual(parse.call_count, 1)
+        doc = second['nested_headings.md'][0]
+        self.assertEqual(len(doc['children']), 2)
+        self.assertIsNot(first, second)
+
+    def test_cache_distinguishes_line_splits(self):
+        """Test that inputs joining to the same text are cached separately."""
+        coordinator = ConversionCoordinator(self.single_heading)
+        with_newlines = ["# A\n", "x\n"]
+        with_blank_lines = ["# A", "", "x", ""]
+        coordinator.convert(with_newlines)
+        
+        cold = coordinator.parser._parse_uncached(with_blank_lines, 'single_heading.md')
+        self.assertEqual(coordinator.convert(with_blank_lines), cold)
+        self.assertEqual(cold['single_heading.md'][0]['content'], '\nx\n')
+
     def test_validation_valid(self):
         """Test validation of valid structure."""
         coordinator = ConversionCoordinator(self.single_heading)
@@ -108,5 +131,37 @@ class TestConversion(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertNotEqual(errors, '')
 
+    def test_validation_empty_title(self):
+        """Test that an invalid single-document structure reports its error."""
+        coordinator = ConversionCoordinator(self.single_heading)
+        data = {'doc.md': [{'title': '  ', 'content': '', 'level': 1, 'children': []}]}
+        
+        is_valid, errors = coordinator.validate(data)
+        self.assertFalse(is_valid)
+        self.assertIn('Content validation failed', errors)
+
+    def test_validation_schema_error_precedence(self):
+        """Test that a later schema error outranks an earlier content error."""
+        coordinator = ConversionCoordinator(self.single_heading)
+        data = {'doc.md': [
+            {'title': ' ', 'content': '', 'level': 1, 'children': []},
+            {'title': 'Second', 'content': 42, 'level': 1, 'children': []}
+        ]}
+        
+        is_valid, errors = coordinator.validate(data)
+        self.assertFalse(is_valid)
+        self.assertIn('Schema validation failed', errors)
+
+    def test_validation_boolean_level(self):
+        """Test that a boolean is not accepted as a section level."""
+        coordinator = ConversionCoordinator(self.single_heading)
+        data = {'doc.md': [
+            {'title': 'Title', 'content': '', 'level': True, 'children': []}
+        ]}
+        
+        is_valid, errors = coordinator.validate(data)
+        self.assertFalse(is_valid)
+        self.assertIn('Level in doc.md must be a int', errors)
+
 if __name__ == '__main__':
     unittest.main()
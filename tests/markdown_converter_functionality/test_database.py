@@ -4,21 +4,22 @@ Unit tests for DatabaseOperationsCoordinator.
 
 import unittest
 import os
+from copy import deepcopy
 from typing import Dict, Any, List, Tuple, Optional
 from markdown_converter.coordinators.database_operations import DatabaseOperationsCoordinator
 
 class TestDatabase(unittest.TestCase):
     """Test cases for DatabaseOperationsCoordinator."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.coordinator = DatabaseOperationsCoordinator()
-        self.test_dir = os.path.join('tests', 'markdown_converter_functionality', 'test_files')
-        os.makedirs(self.test_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test data and open the database connections once."""
+        cls.test_dir = os.path.join('tests', 'markdown_converter_functionality', 'test_files')
+        os.makedirs(cls.test_dir, exist_ok=True)
         
-        # Test data
-        self.test_file = os.path.join(self.test_dir, 'test.md')
-        self.test_data = {
+        # Test data; tests must not mutate it
+        cls.test_file = os.path.join(cls.test_dir, 'test.md')
+        cls.test_data = {
             'test.md': [{
                 'title': 'Main',
                 'content': 'Content',
@@ -31,6 +32,17 @@ class TestDatabase(unittest.TestCase):
                 }]
             }]
         }
+        
+        # Independent copy of the test data with updated main content
+        cls.modified_data = deepcopy(cls.test_data)
+        cls.modified_data['test.md'][0]['content'] = 'Updated content'
+        
+        cls.coordinator = DatabaseOperationsCoordinator()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared database connections."""
+        cls.coordinator.db_handler.close()
 
     def tearDown(self):
         """Clean up test data."""
@@ -43,8 +55,7 @@ class TestDatabase(unittest.TestCase):
         
         # Verify document exists
         doc = self.coordinator.get_document(doc_id)
-        if doc is None:
-            self.fail("Document not found")
+        self.assertIsNotNone(doc, "Document not found")
         self.assertEqual(doc[1], self.test_file)
 
     def test_insert_duplicate_document(self):
@@ -62,8 +73,7 @@ class TestDatabase(unittest.TestCase):
         
         # Verify only one document exists
         doc = self.coordinator.get_document(first_id)
-        if doc is None:
-            self.fail("Document not found")
+        self.assertIsNotNone(doc, "Document not found")
         self.assertEqual(doc[1], self.test_file)
 
     def test_insert_sections(self):
@@ -83,8 +93,8 @@ class TestDatabase(unittest.TestCase):
         main_section = find_section('Main')
         sub_section = find_section('Sub')
         
-        if main_section is None or sub_section is None:
-            self.fail("Required sections not found")
+        self.assertIsNotNone(main_section, "Main section not found")
+        self.assertIsNotNone(sub_section, "Sub section not found")
             
         self.assertIsNone(main_section[1])  # Main section has no parent
         self.assertEqual(sub_section[1], main_section[0])  # Sub section's parent is main section
@@ -96,15 +106,12 @@ class TestDatabase(unittest.TestCase):
         self.assertIsNotNone(doc_id)
         
         # Update with modified data
-        modified_data = self.test_data.copy()
-        modified_data['test.md'][0]['content'] = 'Updated content'
-        self.coordinator.save(self.test_file, modified_data)
+        self.coordinator.save(self.test_file, self.modified_data)
         
         # Verify update
         sections = self.coordinator.get_sections(doc_id)
         main_section = next((s for s in sections if s[2] == 'Main'), None)
-        if main_section is None:
-            self.fail("Main section not found")
+        self.assertIsNotNone(main_section, "Main section not found")
         self.assertEqual(main_section[3], 'Updated content')
 
     def test_validation_result(self):
@@ -114,8 +121,7 @@ class TestDatabase(unittest.TestCase):
         
         # Verify validation result
         result = self.coordinator.get_validation_result(doc_id)
-        if result is None:
-            self.fail("Validation result not found")
+        self.assertIsNotNone(result, "Validation result not found")
         self.assertTrue(result[1])  # is_valid should be True
         self.assertEqual(result[2], '')  # No errors
 
@@ -5,37 +5,42 @@ Unit tests for FileOperationsCoordinator.
 import unittest
 import os
 import json
+import shutil
+import tempfile
+from pathlib import Path
 from markdown_converter.coordinators.file_operations import FileOperationsCoordinator
 
 class TestFileOperations(unittest.TestCase):
     """Test cases for FileOperationsCoordinator."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = os.path.join('tests', 'markdown_converter_functionality', 'test_files')
-        os.makedirs(self.test_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for all tests."""
+        cls.test_dir = tempfile.mkdtemp()
         
         # Create test markdown file
-        self.test_md = os.path.join(self.test_dir, 'test.md')
-        with open(self.test_md, 'w') as f:
+        cls.test_md = os.path.join(cls.test_dir, 'test.md')
+        with open(cls.test_md, 'w') as f:
             f.write("# Test\nContent")
             
         # Create empty file
-        self.empty_md = os.path.join(self.test_dir, 'empty.md')
-        with open(self.empty_md, 'w') as f:
+        cls.empty_md = os.path.join(cls.test_dir, 'empty.md')
+        with open(cls.empty_md, 'w') as f:
             f.write("")
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test files."""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+
+    def tearDown(self):
+        """Remove JSON output written by the test."""
         test_files = [
-            self.test_md,
-            self.empty_md,
             self.test_md.replace('.md', '.json'),
             self.empty_md.replace('.md', '.json')
         ]
         for file in test_files:
-            if os.path.exists(file):
-                os.remove(file)
+            Path(file).unlink(missing_ok=True)
 
     def test_read_valid_file(self):
         """Test reading a valid markdown file."""
@@ -65,10 +70,28 @@ class TestFileOperations(unittest.TestCase):
         output_path = coordinator.get_output_path()
         self.assertTrue(os.path.exists(output_path))
         
-        with open(output_path) as f:
-            saved_data = json.load(f)
+        saved_data = json.loads(Path(output_path).read_bytes())
         self.assertEqual(saved_data, test_data)
 
+    def test_write_non_ascii_json(self):
+        """Test that non-ASCII text and int keys are written as by the stdlib fallback."""
+        coordinator = FileOperationsCoordinator(self.test_md)
+        test_data = {"test.md": [{"title": "Café résumé", "content": "naïve – ok",
+                                  "level": 1, "children": []}],
+                     1: "int key"}
+        coordinator.write_json(test_data)
+        written = Path(coordinator.get_output_path()).read_bytes()
+        
+        # Compared with the fallback's encoding directly rather than by
+        # patching json_writer.orjson, which would leak into tests running
+        # in parallel
+        fallback = json.dumps(test_data, indent=2, ensure_ascii=False).encode('utf-8')
+        self.assertEqual(written, fallback)
+        self.assertIn("Café résumé".encode('utf-8'), written)
+        expected = dict(test_data)
+        expected["1"] = expected.pop(1)
+        self.assertEqual(json.loads(written), expected)
+
     def test_write_existing_json(self):
         """Test writing JSON to an existing file."""
         coordinator = FileOperationsCoordinator(self.test_md)
@@ -82,8 +105,7 @@ class TestFileOperations(unittest.TestCase):
         coordinator.write_json(new_data)
         
         output_path = coordinator.get_output_path()
-        with open(output_path) as f:
-            saved_data = json.load(f)
+        saved_data = json.loads(Path(output_path).read_bytes())
         self.assertEqual(saved_data, new_data)
 
     def test_write_invalid_path(self):
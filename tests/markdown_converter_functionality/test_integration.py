@@ -5,19 +5,41 @@ Integration tests for MarkdownConverter system.
 import unittest
 import os
 import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
 from markdown_converter.markdown_converter import MarkdownConverter
 
+def _flatten(node):
+    """Reduce a section tree to nested (title, children) tuples."""
+    return (node['title'], tuple(_flatten(child) for child in node['children']))
+
+# Expected heading hierarchy of complex.md
+EXPECTED_TREE = (
+    'Main Heading', (
+        ('Section 1', (
+            ('Subsection 1.1', ()),
+        )),
+        ('Section 2', (
+            ('Subsection 2.1', (
+                ('Deep Section', ()),
+            )),
+        )),
+    )
+)
+
 class TestMarkdownConverterIntegration(unittest.TestCase):
     """Integration test cases for MarkdownConverter."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = os.path.join('tests', 'markdown_converter_functionality', 'test_files')
-        os.makedirs(self.test_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for all tests."""
+        cls.test_dir = tempfile.mkdtemp()
         
         # Create test markdown file with complex structure
-        self.test_md = os.path.join(self.test_dir, 'complex.md')
-        with open(self.test_md, 'w') as f:
+        cls.test_md = os.path.join(cls.test_dir, 'complex.md')
+        with open(cls.test_md, 'w') as f:
             f.write("""# Main Heading
 Main content here.
 
@@ -36,15 +58,14 @@ More content here.
 #### Deep Section
 Very deep content.""")
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test files."""
-        test_files = [
-            self.test_md,
-            self.test_md.replace('.md', '.json')
-        ]
-        for file in test_files:
-            if os.path.exists(file):
-                os.remove(file)
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+
+    def tearDown(self):
+        """Remove JSON output written by the test."""
+        Path(self.test_md.replace('.md', '.json')).unlink(missing_ok=True)
 
     def test_complete_conversion_flow(self):
         """Test complete conversion flow."""
@@ -56,41 +77,17 @@ Very deep content.""")
         self.assertTrue(os.path.exists(output_path))
         
         # Verify JSON structure
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(Path(output_path).read_bytes())
         
         # Check document structure
         self.assertIn('complex.md', data)
         root = data['complex.md'][0]
         
-        # Check main heading
-        self.assertEqual(root['title'], 'Main Heading')
+        # Check main heading content
         self.assertIn('Main content', root['content'])
         
-        # Check sections
-        self.assertEqual(len(root['children']), 2)  # Two main sections
-        
-        # Check Section 1
-        section1 = root['children'][0]
-        self.assertEqual(section1['title'], 'Section 1')
-        self.assertEqual(len(section1['children']), 1)  # One subsection
-        
-        # Check Subsection 1.1
-        subsection1 = section1['children'][0]
-        self.assertEqual(subsection1['title'], 'Subsection 1.1')
-        
-        # Check Section 2
-        section2 = root['children'][1]
-        self.assertEqual(section2['title'], 'Section 2')
-        self.assertEqual(len(section2['children']), 1)
-        
-        # Check deep nesting
-        subsection2 = section2['children'][0]
-        self.assertEqual(subsection2['title'], 'Subsection 2.1')
-        self.assertEqual(len(subsection2['children']), 1)
-        
-        deep_section = subsection2['children'][0]
-        self.assertEqual(deep_section['title'], 'Deep Section')
+        # Check the whole heading hierarchy in one comparison
+        self.assertEqual(_flatten(root), EXPECTED_TREE)
 
     def test_database_storage_flow(self):
         """Test conversion with database storage."""
@@ -102,8 +99,7 @@ Very deep content.""")
         self.assertTrue(os.path.exists(output_path))
         
         # Read converted data
-        with open(output_path) as f:
-            data = json.load(f)
+        data = json.loads(Path(output_path).read_bytes())
         
         # Verify structure is preserved
         root = data['complex.md'][0]
@@ -112,30 +108,29 @@ Very deep content.""")
 
     def test_error_handling_flow(self):
         """Test error handling in conversion flow."""
-        # Create invalid markdown file
-        invalid_md = os.path.join(self.test_dir, 'invalid.md')
-        with open(invalid_md, 'w') as f:
-            f.write("Invalid # Heading\nMalformed #content")
-        
-        try:
+        # Feed invalid markdown content without writing it to disk
+        invalid_content = ["Invalid # Heading", "Malformed #content"]
+        converter = MarkdownConverter(self.test_md)
+        # Patched on this converter's coordinator only, not on the class
+        with patch.object(converter.file_coordinator, 'read_content',
+                          return_value=invalid_content):
             # Should handle invalid content gracefully
-            converter = MarkdownConverter(invalid_md)
             output_path = converter.convert()
-            
-            # Should still produce output
-            self.assertTrue(os.path.exists(output_path))
-            
-            # Output should have a valid structure despite invalid input
-            with open(output_path) as f:
-                data = json.load(f)
-            self.assertIn('invalid.md', data)
-            
-        finally:
-            if os.path.exists(invalid_md):
-                os.remove(invalid_md)
-            json_path = invalid_md.replace('.md', '.json')
-            if os.path.exists(json_path):
-                os.remove(json_path)
+        
+        # Should still produce output
+        self.assertTrue(os.path.exists(output_path))
+        
+        # Without any valid heading the output falls back to a single empty
+        # 'Document' section, rather than the sections of complex.md
+        data = json.loads(Path(output_path).read_bytes())
+        self.assertEqual(data, {
+            'complex.md': [{
+                'title': 'Document',
+                'content': '',
+                'level': 1,
+                'children': []
+            }]
+        })
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the document validators.
+"""
+
+import unittest
+from markdown_converter.validators.schema_validator import SchemaValidator
+from markdown_converter.validators.structure_validator import StructureValidator
+
+def _section(**overrides):
+    """Build a valid section, replacing the given fields."""
+    section = {'title': 'Title', 'content': '', 'level': 1, 'children': []}
+    section.update(overrides)
+    return section
+
+class TestSchemaValidator(unittest.TestCase):
+    """Test cases for SchemaValidator."""
+
+    def test_rejects_inexact_field_types(self):
+        """Test that float levels and tuple children are rejected."""
+        validator = SchemaValidator()
+        cases = {
+            'Level': {'doc.md': [_section(level=1.0)]},
+            'Children': {'doc.md': [_section(children=(_section(level=2),))]},
+        }
+        for field, data in cases.items():
+            with self.subTest(field=field):
+                valid, error = validator.validate(data)
+                self.assertFalse(valid)
+                self.assertIn(f'{field} in doc.md', str(error))
+                self.assertEqual(len(validator.validate_all(data)), 1)
+
+    def test_validate_all_collects_errors(self):
+        """Test that every schema error is reported in document order."""
+        data = {'doc.md': [
+            _section(title=1),
+            _section(title='Second', content=None)
+        ]}
+        
+        errors = SchemaValidator().validate_all(data)
+        self.assertEqual(len(errors), 2)
+        self.assertIn('Title in doc.md', str(errors[0]))
+        self.assertIn('Content in doc.md', str(errors[1]))
+
+    def test_revalidates_mutated_tree(self):
+        """Test that a tree mutated in place after passing is checked again."""
+        validator = SchemaValidator()
+        data = {'doc.md': [_section(children=[_section(level=2)])]}
+        self.assertEqual(validator.validate(data), (True, None))
+        
+        data['doc.md'][0]['children'][0]['level'] = '2'
+        valid, error = validator.validate(data)
+        self.assertFalse(valid)
+        self.assertIn('Level', str(error))
+
+class TestStructureValidator(unittest.TestCase):
+    """Test cases for StructureValidator."""
+
+    def test_revalidates_mutated_tree(self):
+        """Test that a tree mutated in place after passing is checked again."""
+        validator = StructureValidator()
+        data = {'doc.md': [_section(children=[_section(level=2)])]}
+        self.assertEqual(validator.validate(data), (True, None))
+        
+        data['doc.md'][0]['children'][0]['level'] = 1
+        valid, error = validator.validate(data)
+        self.assertFalse(valid)
+        self.assertIn('Child level must be greater than parent level', str(error))
+
+    def test_rejects_non_dict_document(self):
+        """Test that empty non-dict input is reported rather than accepted."""
+        valid, error = StructureValidator().validate([])
+        self.assertFalse(valid)
+        self.assertIn('Document data must be a dict', str(error))
+        self.assertEqual(StructureValidator().validate({}), (True, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,19 +15,22 @@ from test_heading_detector import TestHeadingDetector
 from test_content_accumulator import TestContentAccumulator
 from test_tree_manager import TestTreeManager
 
+# Shared loader for all test cases
+LOADER = unittest.TestLoader()
+
 def run_tests():
     """Run all test cases and return the result."""
     # Create test suite
     suite = unittest.TestSuite()
     
     # Add test cases
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestBaseHandler))
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestHeadingDetector))
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestContentAccumulator))
-    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestTreeManager))
+    suite.addTests(LOADER.loadTestsFromTestCase(TestBaseHandler))
+    suite.addTests(LOADER.loadTestsFromTestCase(TestHeadingDetector))
+    suite.addTests(LOADER.loadTestsFromTestCase(TestContentAccumulator))
+    suite.addTests(LOADER.loadTestsFromTestCase(TestTreeManager))
     
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    runner = unittest.TextTestRunner(verbosity=1, buffer=True)
     result = runner.run(suite)
     
     # Return 0 if all tests passed, 1 otherwise
@@ -5,20 +5,49 @@ Tests for the content accumulator component.
 import unittest
 from markdown_converter.markdown_parser.content_accumulator import ContentAccumulator
 
+# Input fixtures; the accumulator only reads them, so they are built once
+SINGLE_BLOCK = (
+    "# Heading",
+    "This is content",
+    "More content"
+)
+MULTIPLE_BLOCKS = (
+    "# First Heading",
+    "Content 1",
+    "More content 1",
+    "## Second Heading",
+    "Content 2",
+    "### Third Heading",
+    "Content 3"
+)
+ONLY_HEADINGS = (
+    "# Heading 1",
+    "## Heading 2",
+    "### Heading 3"
+)
+DICT_CONTENT = {
+    'content': (
+        "# Heading",
+        "Some content"
+    )
+}
+EMPTY_LINES = (
+    "# Heading",
+    "First line",
+    "",
+    "Second line"
+)
+
 class TestContentAccumulator(unittest.TestCase):
     """Test cases for ContentAccumulator class"""
 
-    def setUp(self):
-        self.accumulator = ContentAccumulator()
+    @classmethod
+    def setUpClass(cls):
+        cls.accumulator = ContentAccumulator()
 
     def test_accumulate_single_block(self):
         """Test accumulation of a single content block"""
-        content = [
-            "# Heading",
-            "This is content",
-            "More content"
-        ]
-        result = self.accumulator.handle(content)
+        result = self.accumulator.handle(SINGLE_BLOCK)
         
         self.assertIn('blocks', result)
         self.assertEqual(len(result['blocks']), 1)
@@ -26,16 +55,7 @@ class TestContentAccumulator(unittest.TestCase):
 
     def test_accumulate_multiple_blocks(self):
         """Test accumulation of multiple content blocks"""
-        content = [
-            "# First Heading",
-            "Content 1",
-            "More content 1",
-            "## Second Heading",
-            "Content 2",
-            "### Third Heading",
-            "Content 3"
-        ]
-        result = self.accumulator.handle(content)
+        result = self.accumulator.handle(MULTIPLE_BLOCKS)
         
         self.assertEqual(len(result['blocks']), 3)
         self.assertIn("Content 1\nMore content 1", result['blocks'][0])
@@ -49,23 +69,12 @@ class TestContentAccumulator(unittest.TestCase):
 
     def test_handle_only_headings(self):
         """Test handling content with only headings"""
-        content = [
-            "# Heading 1",
-            "## Heading 2",
-            "### Heading 3"
-        ]
-        result = self.accumulator.handle(content)
+        result = self.accumulator.handle(ONLY_HEADINGS)
         self.assertEqual(len(result['blocks']), 0)
 
     def test_handle_dict_content(self):
         """Test handling of dictionary content"""
-        content = {
-            'content': [
-                "# Heading",
-                "Some content"
-            ]
-        }
-        result = self.accumulator.handle(content)
+        result = self.accumulator.handle(DICT_CONTENT)
         
         self.assertIn('blocks', result)
         self.assertEqual(len(result['blocks']), 1)
@@ -73,13 +82,7 @@ class TestContentAccumulator(unittest.TestCase):
 
     def test_preserve_empty_lines(self):
         """Test that empty lines between content are preserved"""
-        content = [
-            "# Heading",
-            "First line",
-            "",
-            "Second line"
-        ]
-        result = self.accumulator.handle(content)
+        result = self.accumulator.handle(EMPTY_LINES)
         
         self.assertEqual(len(result['blocks']), 1)
         self.assertIn("First line\n\nSecond line", result['blocks'][0])
@@ -3,18 +3,36 @@ Tests for the heading detector component.
 """
 
 import unittest
+from unittest.mock import Mock, patch
+from markdown_converter.markdown_parser import heading_detector
 from markdown_converter.markdown_parser.heading_detector import HeadingDetector
 
+# Input fixtures; the detector only reads them, so they are built once
+SINGLE_HEADING = ("# Test Heading",)
+MULTIPLE_HEADINGS = (
+    "# Heading 1",
+    "## Heading 2",
+    "### Heading 3"
+)
+MIXED_HEADINGS = (
+    "#Invalid Heading",  # No space after #
+    "Not a heading",
+    "###### Valid Heading"  # Valid h6 heading
+)
+DICT_CONTENT = {
+    'content': ("# Test Heading",)
+}
+
 class TestHeadingDetector(unittest.TestCase):
     """Test cases for HeadingDetector class"""
 
-    def setUp(self):
-        self.detector = HeadingDetector()
+    @classmethod
+    def setUpClass(cls):
+        cls.detector = HeadingDetector()
 
     def test_detect_single_heading(self):
         """Test detection of a single heading"""
-        content = ["# Test Heading"]
-        result = self.detector.handle(content)
+        result = self.detector.handle(SINGLE_HEADING)
         
         self.assertIn('headings', result)
         self.assertEqual(len(result['headings']), 1)
@@ -23,12 +41,7 @@ class TestHeadingDetector(unittest.TestCase):
 
     def test_detect_multiple_headings(self):
         """Test detection of multiple headings"""
-        content = [
-            "# Heading 1",
-            "## Heading 2",
-            "### Heading 3"
-        ]
-        result = self.detector.handle(content)
+        result = self.detector.handle(MULTIPLE_HEADINGS)
         
         self.assertEqual(len(result['headings']), 3)
         self.assertEqual(result['headings'][0]['level'], 1)
@@ -37,12 +50,7 @@ class TestHeadingDetector(unittest.TestCase):
 
     def test_ignore_invalid_headings(self):
         """Test that invalid headings are ignored"""
-        content = [
-            "#Invalid Heading",  # No space after #
-            "Not a heading",
-            "###### Valid Heading"  # Valid h6 heading
-        ]
-        result = self.detector.handle(content)
+        result = self.detector.handle(MIXED_HEADINGS)
         
         self.assertEqual(len(result['headings']), 1)
         self.assertEqual(result['headings'][0]['level'], 6)
@@ -55,13 +63,25 @@ class TestHeadingDetector(unittest.TestCase):
 
     def test_handle_dict_content(self):
         """Test handling of dictionary content"""
-        content = {
-            'content': ["# Test Heading"]
-        }
-        result = self.detector.handle(content)
+        result = self.detector.handle(DICT_CONTENT)
         
         self.assertIn('headings', result)
         self.assertEqual(len(result['headings']), 1)
 
+    def test_pattern_compiled_once(self):
+        """Test that detectors share the module's precompiled pattern"""
+        self.assertIs(HeadingDetector.heading_pattern, heading_detector._HEADING_RE)
+        self.assertIs(HeadingDetector().heading_pattern, self.detector.heading_pattern)
+
+    def test_pattern_only_runs_on_candidate_lines(self):
+        """Test that the pattern is matched once per '#' line and never otherwise"""
+        content = ["Plain text"] * 1000 + ["###### x"] * 10 + ["#######" + " x" * 50] * 5
+        pattern = Mock(wraps=heading_detector._HEADING_RE)
+        with patch.object(heading_detector, '_HEADING_RE', pattern):
+            result = self.detector.handle(content)
+
+        self.assertEqual(len(result['headings']), 10)
+        self.assertEqual(pattern.match.call_count, 15)
+
 if __name__ == '__main__':
     unittest.main()
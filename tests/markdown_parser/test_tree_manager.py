@@ -9,8 +9,9 @@ from markdown_converter.markdown_parser.tree_manager import TreeManager
 class TestTreeManager(unittest.TestCase):
     """Test cases for TreeManager class"""
 
-    def setUp(self):
-        self.manager = TreeManager()
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = TreeManager()
 
     def test_build_simple_tree(self):
         """Test building a simple tree structure"""
@@ -52,6 +53,25 @@ class TestTreeManager(unittest.TestCase):
         self.assertEqual(len(h1['children'][0]['children']), 1)
         self.assertEqual(h1['children'][1]['title'], 'H2-2')
 
+    def test_close_multiple_levels(self):
+        """Test that a shallow heading closes several open sections at once"""
+        content: Dict[str, Any] = {
+            'headings': [
+                {'level': 1, 'title': 'H1', 'content': ''},
+                {'level': 2, 'title': 'H2', 'content': ''},
+                {'level': 4, 'title': 'H4', 'content': ''},
+                {'level': 1, 'title': 'H1-2', 'content': ''},
+                {'level': 3, 'title': 'H3', 'content': ''}
+            ],
+            'blocks': []
+        }
+        result = self.manager.handle(content)
+        
+        tree = result['tree']
+        self.assertEqual([node['title'] for node in tree], ['H1', 'H1-2'])
+        self.assertEqual(tree[0]['children'][0]['children'][0]['title'], 'H4')
+        self.assertEqual(tree[1]['children'][0]['title'], 'H3')
+
     def test_handle_empty_content(self):
         """Test handling of empty content"""
         result = self.manager.handle({})
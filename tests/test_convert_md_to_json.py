@@ -1,34 +1,37 @@
 import os
 import json
+import tempfile
 import unittest
+from pathlib import Path
 from markdown_converter.markdown_converter import MarkdownConverter
 
 class TestMarkdownConverter(unittest.TestCase):
-    def setUp(self):
-        # Create a sample markdown file for testing
-        self.sample_md_content = "# Sample Title\n\nThis is a sample markdown content."
-        self.sample_md_file = "sample_test.md"
-        with open(self.sample_md_file, "w") as f:
-            f.write(self.sample_md_content)
+    @classmethod
+    def setUpClass(cls):
+        # Create a sample markdown file in a private temporary directory;
+        # the JSON output is written next to it
+        cls.sample_md_content = "# Sample Title\n\nThis is a sample markdown content."
+        cls._td = tempfile.TemporaryDirectory()
+        cls.sample_md_file = os.path.join(cls._td.name, "sample_test.md")
+        Path(cls.sample_md_file).write_text(cls.sample_md_content)
 
-    def tearDown(self):
-        # Clean up the sample markdown file and JSON output
-        if os.path.exists(self.sample_md_file):
-            os.remove(self.sample_md_file)
-        if os.path.exists("sample_test.json"):
-            os.remove("sample_test.json")
+        # Convert once without the database; tests only read the result
+        cls.output_path = MarkdownConverter(cls.sample_md_file, save_to_db=False).convert()
+        with open(cls.output_path, "r") as f:
+            cls._tree = json.load(f)
+
+    @classmethod
+    def tearDownClass(cls):
+        # Remove the sample markdown file and JSON output with the directory
+        cls._td.cleanup()
 
     def test_convert_to_json(self):
         # Test conversion to JSON without saving to database
-        converter = MarkdownConverter(self.sample_md_file, save_to_db=False)
-        output_path = converter.convert()
-        self.assertTrue(os.path.exists(output_path))
-
-        with open(output_path, "r") as f:
-            data = json.load(f)
-            self.assertIn("sample_test.md", data)
-            self.assertEqual(data["sample_test.md"][0]["title"], "Sample Title")
+        self.assertTrue(os.path.exists(self.output_path))
+        self.assertIn("sample_test.md", self._tree)
+        self.assertEqual(self._tree["sample_test.md"][0]["title"], "Sample Title")
 
+    @unittest.skipUnless(os.environ.get("RUN_DB_TESTS"), "set RUN_DB_TESTS to run against a live database")
     def test_convert_to_json_with_db(self):
         # Test conversion to JSON with saving to database
         # Note: This test assumes a valid database connection is available